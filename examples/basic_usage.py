@@ -221,11 +221,19 @@ async def async_usage():
     
     # Simple async requests work the same way
     async with polvo.AsyncSession("https://httpbin.org") as session:
-        response = await session.get("/get")
-        print(f"Async GET: {response.status_code}")
+        # Independent calls don't need to wait for each other
+        get_response, post_response = await asyncio.gather(
+            session.get("/get"),
+            session.post("/post", json={"async": True}),
+        )
+        print(f"Async GET: {get_response.status_code}")
+        print(f"Async POST: {post_response.status_code}")
         
-        response = await session.post("/post", json={"async": True})
-        print(f"Async POST: {response.status_code}")
+        # Concurrent requests share one HTTP/2 connection
+        responses = await session.gather(
+            *(("GET", "/get", {"params": {"request": i}}) for i in range(3))
+        )
+        print(f"Concurrent GETs: {[r.status_code for r in responses]}")
 
 
 def show_the_tradeoffs():
@@ -238,7 +246,7 @@ def show_the_tradeoffs():
     print("  response = polvo.get('https://api.example.com/data')")
     print("  ✓ Dead simple")
     print("  ✓ No configuration")
-    print("  ✗ No connection reuse")
+    print("  ✓ Connection reuse (shared pool across calls)")
     print("  ✗ No retry/rate limiting")
     
     print("\nROBUST (5% of use cases):")
@@ -249,6 +257,12 @@ def show_the_tradeoffs():
     print("  ✓ Shared configuration")
     print("  ✗ More setup required")
     
+    print("\nCONCURRENT (async fan-out):")
+    print("  responses = await session.gather(('GET', '/a'), ('GET', '/b'))")
+    print("  ✓ Requests run concurrently over shared connections")
+    print("  ✓ Same auth, retry and rate limiting as single requests")
+    print("  ✗ Requires an AsyncSession")
+    
     print("\nPRODUCTION OAuth2 (Progressive disclosure):")
     print("  Simple:   oauth = polvo.auth.oauth2(client_id, secret, token_url)")
     print("            # Uses memory storage with warning")
@@ -294,7 +308,8 @@ if __name__ == "__main__":
     oauth2_simple_and_explicit()
     production_resilience_patterns()
     
-    # Show async usage
+    # Show async usage (uvloop is used when installed: pip install usepolvo[uvloop])
+    polvo.transport.install_uvloop()
     asyncio.run(async_usage())
     
     # Show the design tradeoffs
@@ -30,23 +30,36 @@ Usage:
 
 Async Support:
     - Full async support with AsyncSession
+    - Optional aiohttp transport for high-concurrency workloads (transport="aiohttp")
     - OAuth2 token refresh uses sync internally (infrequent operations)
     - Rate limiting and retry work with both sync and async
 """
 
 __version__ = "2.0.0"
 
+import importlib
+
 # Import Session classes
 from .api import Session, AsyncSession
 
 # Import module-level convenience functions
 from .api import get, post, put, patch, delete, head, options
 
-# Import submodules
-from . import auth
-from . import storage
-from . import retry
-from . import rate_limit
+# Submodules are imported lazily on first attribute access, so a plain
+# `import polvo` doesn't load cryptography and the OAuth2 machinery.
+_SUBMODULES = frozenset({"auth", "storage", "retry", "rate_limit", "transport"})
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
 
 __all__ = [
     # Module-level functions (primary interface)
@@ -56,5 +69,5 @@ __all__ = [
     "Session", "AsyncSession",
     
     # Submodules
-    "auth", "storage", "retry", "rate_limit"
+    "auth", "storage", "retry", "rate_limit", "transport"
 ] 
\ No newline at end of file
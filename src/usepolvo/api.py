@@ -2,13 +2,174 @@
 Main API client that provides a requests-like interface.
 """
 
+import asyncio
+import atexit
+import contextlib
+import functools
+import math
+import os
+import ssl
+import threading
 import httpx
-from typing import Any, Dict, Optional, Union, List, Tuple
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, Optional, Union, List, Tuple
 from urllib.parse import urljoin
 
-from .auth.base import AuthStrategy
-from .resilience import RetryStrategy, RateLimiter
-from .storage.base import TokenStorage
+try:
+    import orjson
+except ImportError:  # Optional speedup
+    orjson = None
+
+from .resilience import IDEMPOTENT_HTTP_METHODS, RetryStrategy
+from .transport import AiohttpTransport
+
+if TYPE_CHECKING:
+    # Imported for annotations only; auth pulls in storage and cryptography
+    from .auth.base import AuthStrategy
+    from .resilience import RateLimiter
+
+
+IDEMPOTENCY_KEY_HEADER = 'Idempotency-Key'
+
+# httpx's pool sizes, but idle connections are kept for 30s instead of 5s so
+# clients that pause between calls still reuse their TLS/HTTP2 connections.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# Named transports accepted by AsyncSession(transport=...)
+ASYNC_TRANSPORTS = {
+    'aiohttp': AiohttpTransport,
+}
+
+
+def _join_url(base_url: str, path: str) -> str:
+    """Join a base URL (without trailing slash) and a relative path."""
+    path = path.lstrip('/')
+    # Plain paths like "users/42" join by concatenation; only paths that may
+    # hold dot segments, empty segments or a scheme need urljoin's resolution
+    if '.' in path or ':' in path or '//' in path:
+        return _urljoin_cached(base_url, path)
+    return f"{base_url}/{path}"
+
+
+@functools.lru_cache(maxsize=256)
+def _urljoin_cached(base_url: str, path: str) -> str:
+    """Resolve a path against a base URL, cached since sessions reuse the same paths."""
+    return urljoin(base_url + '/', path)
+
+
+@functools.lru_cache(maxsize=None)
+def _default_ssl_context(http2: bool) -> ssl.SSLContext:
+    """
+    Build the certificate-verifying SSL context shared by default sessions.
+    
+    Mirrors httpx's verify=True setup (SSL_CERT_FILE / SSL_CERT_DIR, else
+    certifi), but loads the CA bundle once per process instead of once per
+    client, which otherwise costs tens of milliseconds per Session.
+    
+    httpcore sets the ALPN protocols on the context for every connection,
+    so HTTP/1.1-only and HTTP/2 clients each get their own context; sharing
+    one would let an http2=False session negotiate h2.
+    """
+    import certifi
+    
+    if os.environ.get('SSL_CERT_FILE'):
+        return ssl.create_default_context(cafile=os.environ['SSL_CERT_FILE'])
+    if os.environ.get('SSL_CERT_DIR'):
+        return ssl.create_default_context(capath=os.environ['SSL_CERT_DIR'])
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+def _uses_default_tls(kwargs: Dict[str, Any]) -> bool:
+    """Check whether client kwargs leave TLS verification at httpx's defaults."""
+    return (
+        'verify' not in kwargs
+        and 'cert' not in kwargs
+        and kwargs.get('trust_env', True)
+    )
+
+
+def _reject_client_options(options: Dict[str, Any]) -> None:
+    """
+    Refuse client configuration passed alongside a borrowed client.
+    
+    A shared client keeps its own pool, transport and TLS settings, so these
+    options would otherwise be dropped without a word.
+    """
+    if options:
+        raise TypeError(
+            f"client= cannot be combined with {', '.join(sorted(options))}; "
+            "configure the shared client instead"
+        )
+
+
+def _invalidate_auth(auth: 'AuthStrategy', response: httpx.Response) -> None:
+    """Tell the auth strategy which credential a 401 response rejected."""
+    _, _, token = response.request.headers.get('authorization', '').partition(' ')
+    auth.invalidate(token or None)
+
+
+def _pool_limits(rate_limit: Optional['RateLimiter'] = None) -> httpx.Limits:
+    """
+    Size the connection pool so it never caps throughput below the rate limiter.
+    
+    Uses DEFAULT_LIMITS as a floor.
+    """
+    burst = int(getattr(rate_limit, 'burst_size', 0) or 0)
+    if burst <= DEFAULT_LIMITS.max_keepalive_connections:
+        return DEFAULT_LIMITS
+    return httpx.Limits(
+        max_connections=max(DEFAULT_LIMITS.max_connections, burst * 2),
+        max_keepalive_connections=burst,
+        keepalive_expiry=DEFAULT_LIMITS.keepalive_expiry,
+    )
+
+
+def _has_header(headers: Dict[str, str], name: str) -> bool:
+    """Check for a header name case-insensitively."""
+    name = name.lower()
+    return any(key.lower() == name for key in headers)
+
+
+def _has_non_finite_float(value: Any) -> bool:
+    """Check a JSON-like structure for NaN or infinite floats."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite_float(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite_float(item) for item in value)
+    return False
+
+
+def _encode_json_body(kwargs: Dict[str, Any], headers: Dict[str, str]) -> None:
+    """
+    Serialize a json= request body with orjson when it is installed.
+    
+    Falls back to httpx's stdlib encoder for values orjson can't handle,
+    and for NaN/Infinity, which orjson would silently send as null where
+    httpx raises.
+    """
+    body = kwargs.get('json')
+    if orjson is None or body is None or kwargs.get('data') is not None or 'content' in kwargs:
+        return
+    
+    try:
+        content = orjson.dumps(body)
+    except TypeError:
+        return
+    
+    # Non-finite floats can only hide behind a "null" in orjson's output
+    if b'null' in content and _has_non_finite_float(body):
+        return
+    
+    del kwargs['json']
+    kwargs['content'] = content
+    if not _has_header(headers, 'Content-Type'):
+        headers['Content-Type'] = 'application/json'
 
 
 class Session:
@@ -19,15 +180,22 @@ class Session:
     and multi-tenant scenarios while providing a familiar requests-style API.
     """
     
+    __slots__ = (
+        "base_url", "auth", "retry", "rate_limit", "timeout", "default_headers",
+        "_owns_client", "_client"
+    )
+    
     def __init__(
         self,
         base_url: str,
-        auth: Optional[AuthStrategy] = None,
-        retry: Optional[RetryStrategy] = None,
-        rate_limit: Optional[RateLimiter] = None,
+        auth: Optional['AuthStrategy'] = None,
+        retry: Optional['RetryStrategy'] = None,
+        rate_limit: Optional['RateLimiter'] = None,
         # circuit_breaker: Optional[CircuitBreaker] = None,  # TODO: Implement circuit breaker
         timeout: float = 30.0,
         headers: Optional[Dict[str, str]] = None,
+        client: Optional[httpx.Client] = None,
+        http2: bool = True,
         **kwargs
     ):
         """
@@ -40,6 +208,10 @@ class Session:
             rate_limit: Rate limiting strategy
             timeout: Request timeout in seconds
             headers: Default headers to include with requests
+            client: Existing httpx.Client to share; it is not closed by this session.
+                The client keeps its own settings: timeout is ignored, and
+                http2=False or extra kwargs raise TypeError
+            http2: Negotiate HTTP/2 so concurrent requests share one connection
             **kwargs: Additional arguments passed to httpx.Client
         """
         self.base_url = base_url.rstrip('/')
@@ -49,9 +221,25 @@ class Session:
         self.timeout = timeout
         self.default_headers = headers or {}
         
+        # Borrow a shared client as-is; pool and TLS options belong to its owner
+        self._owns_client = client is None
+        if client is not None:
+            options = dict(kwargs)
+            if not http2:
+                options['http2'] = http2
+            _reject_client_options(options)
+            self._client = client
+            return
+        
+        if 'limits' not in kwargs:
+            kwargs['limits'] = _pool_limits(rate_limit)
+        if _uses_default_tls(kwargs):
+            kwargs['verify'] = _default_ssl_context(http2)
+        
         # Initialize httpx client
         self._client = httpx.Client(
             timeout=timeout,
+            http2=http2,
             **kwargs
         )
         
@@ -62,27 +250,23 @@ class Session:
         self.close()
         
     def close(self):
-        """Close the underlying HTTP client."""
-        self._client.close()
+        """Close the underlying HTTP client, unless it is shared."""
+        if self._owns_client:
+            self._client.close()
         
     def _build_url(self, path: str) -> str:
         """Build full URL from base URL and path."""
         if path.startswith(('http://', 'https://')):
             return path
-        return urljoin(self.base_url + '/', path.lstrip('/'))
+        return _join_url(self.base_url, path)
     
     def _prepare_headers(self, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """Prepare headers including auth and defaults."""
-        final_headers = self.default_headers.copy()
+        # Build the merged dict in one pass; auth headers win over everything
+        auth_headers = self.auth.get_headers() if self.auth else {}
         if headers:
-            final_headers.update(headers)
-            
-        # Apply authentication
-        if self.auth:
-            auth_headers = self.auth.get_headers()
-            final_headers.update(auth_headers)
-            
-        return final_headers
+            return {**self.default_headers, **headers, **auth_headers}
+        return {**self.default_headers, **auth_headers}
     
     def _make_request(
         self, 
@@ -97,20 +281,78 @@ class Session:
         full_url = self._build_url(url)
         final_headers = self._prepare_headers(headers)
         
-        # Apply rate limiting
-        if self.rate_limit:
-            self.rate_limit.acquire()
+        # Error responses are only retried if resending can't duplicate a write:
+        # an idempotent method, or a key the caller knows the server honours
+        resendable = (
+            method.upper() in IDEMPOTENT_HTTP_METHODS
+            or _has_header(final_headers, IDEMPOTENCY_KEY_HEADER)
+        )
+        
+        # One idempotency key per logical request, reused by every retry
+        make_key = getattr(self.retry, 'idempotency_key', None)
+        if make_key and not _has_header(final_headers, IDEMPOTENCY_KEY_HEADER):
+            idempotency_key = make_key(method)
+            if idempotency_key:
+                final_headers[IDEMPOTENCY_KEY_HEADER] = idempotency_key
+        
+        _encode_json_body(kwargs, final_headers)
+        
+        def send() -> httpx.Response:
+            # Apply rate limiting to every attempt, including retries
+            if self.rate_limit:
+                self.rate_limit.acquire()
+            
+            response = self._client.request(method, full_url, headers=final_headers, **kwargs)
+            
+            # A rejected token is stale: refresh it and replay the request once
+            if response.status_code == 401 and hasattr(self.auth, 'invalidate'):
+                _invalidate_auth(self.auth, response)
+                response.close()
+                final_headers.update(self.auth.get_headers())
+                if self.rate_limit:
+                    self.rate_limit.acquire()
+                response = self._client.request(method, full_url, headers=final_headers, **kwargs)
+            
+            # Let adaptive limiters learn from the response
+            if self.rate_limit and hasattr(self.rate_limit, 'update_from_response'):
+                self.rate_limit.update_from_response(response)
+            return response
         
         # Apply retry logic if configured
+        if isinstance(self.retry, RetryStrategy):
+            return self.retry.execute(send, resendable=resendable)
         if self.retry:
-            return self.retry.execute(
-                lambda: self._client.request(
-                    method, full_url, headers=final_headers, **kwargs
-                )
-            )
+            return self.retry.execute(send)
         
         # Simple request without retry
-        return self._client.request(method, full_url, headers=final_headers, **kwargs)
+        return send()
+    
+    @contextlib.contextmanager
+    def stream(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> Iterator[httpx.Response]:
+        """
+        Make a request and stream the response body as it arrives.
+        
+        Auth and rate limiting apply as usual, but the request is not retried
+        since a partially consumed body can't be replayed.
+        
+        Example:
+            with session.stream("GET", "/events") as response:
+                for line in response.iter_lines():
+                    print(line)
+        """
+        full_url = self._build_url(url)
+        final_headers = self._prepare_headers(headers)
+        _encode_json_body(kwargs, final_headers)
+        
+        if self.rate_limit:
+            self.rate_limit.acquire()
+        
+        with self._client.stream(method, full_url, headers=final_headers, **kwargs) as response:
+            if response.status_code == 401 and hasattr(self.auth, 'invalidate'):
+                _invalidate_auth(self.auth, response)
+            if self.rate_limit and hasattr(self.rate_limit, 'update_from_response'):
+                self.rate_limit.update_from_response(response)
+            yield response
     
     # Requests-like interface methods
     def get(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> httpx.Response:
@@ -209,16 +451,44 @@ class AsyncSession:
     Provides the same interface as Session but with async/await support.
     """
     
+    __slots__ = (
+        "base_url", "auth", "retry", "rate_limit", "timeout", "default_headers",
+        "_owns_client", "_client"
+    )
+    
     def __init__(
         self,
         base_url: str,
-        auth: Optional[AuthStrategy] = None,
-        retry: Optional[RetryStrategy] = None,
-        rate_limit: Optional[RateLimiter] = None,
+        auth: Optional['AuthStrategy'] = None,
+        retry: Optional['RetryStrategy'] = None,
+        rate_limit: Optional['RateLimiter'] = None,
         timeout: float = 30.0,
         headers: Optional[Dict[str, str]] = None,
+        transport: Union[str, httpx.AsyncBaseTransport, None] = None,
+        http2: bool = True,
+        client: Optional[httpx.AsyncClient] = None,
         **kwargs
     ):
+        """
+        Initialize the async API client.
+        
+        Args:
+            base_url: Base URL for all requests
+            auth: Authentication strategy (Bearer, OAuth2, etc.)
+            retry: Retry strategy with exponential backoff
+            rate_limit: Rate limiting strategy
+            timeout: Request timeout in seconds
+            headers: Default headers to include with requests
+            transport: A name from ASYNC_TRANSPORTS (e.g. "aiohttp" for an aiohttp
+                connection pool), or any httpx.AsyncBaseTransport (default: httpx's own)
+            http2: Negotiate HTTP/2 so concurrent requests share one connection
+                (ignored by the aiohttp transport, which speaks HTTP/1.1)
+            client: Existing httpx.AsyncClient to share, so sessions for the same
+                host use one connection pool; it is not closed by this session.
+                The client keeps its own settings: timeout is ignored, and
+                transport, http2=False or extra kwargs raise TypeError
+            **kwargs: Additional arguments passed to httpx.AsyncClient
+        """
         self.base_url = base_url.rstrip('/')
         self.auth = auth
         self.retry = retry
@@ -226,9 +496,43 @@ class AsyncSession:
         self.timeout = timeout
         self.default_headers = headers or {}
         
+        # Borrow a shared client as-is; pool and transport options belong to its owner
+        self._owns_client = client is None
+        if client is not None:
+            options = dict(kwargs)
+            if transport is not None:
+                options['transport'] = transport
+            if not http2:
+                options['http2'] = http2
+            _reject_client_options(options)
+            self._client = client
+            return
+        
+        limits = kwargs.get('limits')
+        if limits is None:
+            limits = kwargs['limits'] = _pool_limits(rate_limit)
+        
+        if isinstance(transport, str):
+            transport_class = ASYNC_TRANSPORTS.get(transport)
+            if transport_class is None:
+                raise ValueError(
+                    f"Unknown transport: {transport!r} "
+                    f"(expected one of: {', '.join(sorted(ASYNC_TRANSPORTS))})"
+                )
+            # httpx ignores TLS settings when a transport is supplied, so hand them over
+            transport = transport_class(
+                limit=limits.max_connections or 0,
+                keepalive_timeout=limits.keepalive_expiry,
+                verify=kwargs.get('verify', True),
+            )
+        elif transport is None and _uses_default_tls(kwargs):
+            kwargs['verify'] = _default_ssl_context(http2)
+        
         # Initialize async httpx client
         self._client = httpx.AsyncClient(
             timeout=timeout,
+            transport=transport,
+            http2=http2,
             **kwargs
         )
     
@@ -239,30 +543,36 @@ class AsyncSession:
         await self.close()
     
     async def close(self):
-        """Close the underlying HTTP client."""
-        await self._client.aclose()
+        """Close the underlying HTTP client, unless it is shared."""
+        if self._owns_client:
+            await self._client.aclose()
     
     def _build_url(self, path: str) -> str:
         """Build full URL from base URL and path."""
         if path.startswith(('http://', 'https://')):
             return path
-        return urljoin(self.base_url + '/', path.lstrip('/'))
+        return _join_url(self.base_url, path)
     
     async def _prepare_headers(self, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """Prepare headers including auth and defaults."""
-        final_headers = self.default_headers.copy()
+        # Build the merged dict in one pass; auth headers win over everything
+        auth_headers = await self._auth_headers() if self.auth else {}
         if headers:
-            final_headers.update(headers)
-            
-        # Apply authentication (async)
-        if self.auth:
-            if hasattr(self.auth, 'get_headers_async'):
-                auth_headers = await self.auth.get_headers_async()
-            else:
-                auth_headers = self.auth.get_headers()
-            final_headers.update(auth_headers)
-            
-        return final_headers
+            return {**self.default_headers, **headers, **auth_headers}
+        return {**self.default_headers, **auth_headers}
+    
+    async def _acquire_rate_limit(self) -> None:
+        """Wait for the rate limiter, preferring its non-blocking variant."""
+        if self.rate_limit and hasattr(self.rate_limit, 'acquire_async'):
+            await self.rate_limit.acquire_async()
+        elif self.rate_limit:
+            self.rate_limit.acquire()
+    
+    async def _auth_headers(self) -> Dict[str, str]:
+        """Get headers from the auth strategy, preferring its async variant."""
+        if hasattr(self.auth, 'get_headers_async'):
+            return await self.auth.get_headers_async()
+        return self.auth.get_headers()
     
     async def _make_request(
         self, 
@@ -275,22 +585,75 @@ class AsyncSession:
         full_url = self._build_url(url)
         final_headers = await self._prepare_headers(headers)
         
-        # Apply rate limiting
-        if self.rate_limit and hasattr(self.rate_limit, 'acquire_async'):
-            await self.rate_limit.acquire_async()
-        elif self.rate_limit:
-            self.rate_limit.acquire()
+        # Error responses are only retried if resending can't duplicate a write:
+        # an idempotent method, or a key the caller knows the server honours
+        resendable = (
+            method.upper() in IDEMPOTENT_HTTP_METHODS
+            or _has_header(final_headers, IDEMPOTENCY_KEY_HEADER)
+        )
+        
+        # One idempotency key per logical request, reused by every retry
+        make_key = getattr(self.retry, 'idempotency_key', None)
+        if make_key and not _has_header(final_headers, IDEMPOTENCY_KEY_HEADER):
+            idempotency_key = make_key(method)
+            if idempotency_key:
+                final_headers[IDEMPOTENCY_KEY_HEADER] = idempotency_key
+        
+        _encode_json_body(kwargs, final_headers)
+        
+        async def send() -> httpx.Response:
+            # Apply rate limiting to every attempt, including retries
+            await self._acquire_rate_limit()
+            
+            response = await self._client.request(method, full_url, headers=final_headers, **kwargs)
+            
+            # A rejected token is stale: refresh it and replay the request once
+            if response.status_code == 401 and hasattr(self.auth, 'invalidate'):
+                _invalidate_auth(self.auth, response)
+                await response.aclose()
+                final_headers.update(await self._auth_headers())
+                await self._acquire_rate_limit()
+                response = await self._client.request(method, full_url, headers=final_headers, **kwargs)
+            
+            # Let adaptive limiters learn from the response
+            if self.rate_limit and hasattr(self.rate_limit, 'update_from_response'):
+                self.rate_limit.update_from_response(response)
+            return response
         
         # Apply retry logic if configured
+        if isinstance(self.retry, RetryStrategy):
+            return await self.retry.execute_async(send, resendable=resendable)
         if self.retry and hasattr(self.retry, 'execute_async'):
-            return await self.retry.execute_async(
-                lambda: self._client.request(
-                    method, full_url, headers=final_headers, **kwargs
-                )
-            )
+            return await self.retry.execute_async(send)
         
         # Simple request without retry
-        return await self._client.request(method, full_url, headers=final_headers, **kwargs)
+        return await send()
+    
+    @contextlib.asynccontextmanager
+    async def stream(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> AsyncIterator[httpx.Response]:
+        """
+        Make an async request and stream the response body as it arrives.
+        
+        Auth and rate limiting apply as usual, but the request is not retried
+        since a partially consumed body can't be replayed.
+        
+        Example:
+            async with session.stream("GET", "/events") as response:
+                async for line in response.aiter_lines():
+                    print(line)
+        """
+        full_url = self._build_url(url)
+        final_headers = await self._prepare_headers(headers)
+        _encode_json_body(kwargs, final_headers)
+        
+        await self._acquire_rate_limit()
+        
+        async with self._client.stream(method, full_url, headers=final_headers, **kwargs) as response:
+            if response.status_code == 401 and hasattr(self.auth, 'invalidate'):
+                _invalidate_auth(self.auth, response)
+            if self.rate_limit and hasattr(self.rate_limit, 'update_from_response'):
+                self.rate_limit.update_from_response(response)
+            yield response
     
     # Async requests-like interface methods
     async def get(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> httpx.Response:
@@ -320,27 +683,90 @@ class AsyncSession:
     async def options(self, url: str, **kwargs) -> httpx.Response:
         """Make an async OPTIONS request."""
         return await self._make_request('OPTIONS', url, **kwargs)
+    
+    async def gather(self, *requests: Tuple[Any, ...]) -> List[httpx.Response]:
+        """
+        Make several requests concurrently.
+        
+        Each request is a (method, url) or (method, url, kwargs) tuple. All
+        requests go through the same auth, rate limiting and retry logic as
+        the single-request methods, and share the session's connections.
+        
+        Args:
+            *requests: Request specifications
+            
+        Returns:
+            Responses in the same order as the requests
+            
+        Example:
+            responses = await session.gather(
+                ("GET", "/users"),
+                ("POST", "/events", {"json": {"type": "login"}}),
+            )
+        """
+        return list(await asyncio.gather(*(
+            self._make_request(spec[0], spec[1], **(spec[2] if len(spec) > 2 else {}))
+            for spec in requests
+        )))
 
 
 
 
 
 # Module-level convenience functions (like requests)
+
+# Process-wide connection pool shared by the module-level functions, so
+# repeated polvo.get() calls to the same host reuse keep-alive connections.
+_default_client: Optional[httpx.Client] = None
+_default_client_lock = threading.Lock()
+
+def _get_default_client() -> httpx.Client:
+    """Return the shared httpx.Client, creating it on first use."""
+    global _default_client
+    
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                # Reject all cookies so one-off calls stay stateless, like requests.get()
+                no_cookies = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+                _default_client = httpx.Client(
+                    timeout=30.0,
+                    http2=True,
+                    cookies=no_cookies,
+                    limits=DEFAULT_LIMITS,
+                    verify=_default_ssl_context(http2=True),
+                )
+    return _default_client
+
+
+@atexit.register
+def _close_default_client() -> None:
+    """Close the shared connection pool at interpreter exit."""
+    global _default_client
+    
+    with _default_client_lock:
+        if _default_client is not None:
+            _default_client.close()
+            _default_client = None
+
+
+# Session-level arguments accepted by the module-level functions
+_SESSION_ARGS = frozenset({'auth', 'retry', 'rate_limit', 'headers'})
+
+
 def _create_session_from_kwargs(**kwargs) -> Tuple[Session, Dict[str, Any]]:
     """Extract session-related kwargs and create a temporary Session."""
     session_kwargs = {}
     request_kwargs = {}
     
-    # Session-level arguments
-    session_args = {'auth', 'retry', 'rate_limit', 'timeout', 'headers'}
-    
     for key, value in kwargs.items():
-        if key in session_args:
+        if key in _SESSION_ARGS:
             session_kwargs[key] = value
         else:
+            # Includes 'timeout', which httpx accepts per request
             request_kwargs[key] = value
     
-    session = Session("", **session_kwargs)
+    session = Session("", client=_get_default_client(), **session_kwargs)
     return session, request_kwargs
 
 
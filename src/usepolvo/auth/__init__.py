@@ -158,7 +158,8 @@ class OAuth2(OAuth2Flow):
     Use this for APIs that use OAuth2 client credentials flow.
     Same as OAuth2Flow but with a shorter name.
     """
-    pass
+    
+    __slots__ = ()
 
 
 __all__ = [
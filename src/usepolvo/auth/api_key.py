@@ -13,6 +13,8 @@ class APIKeyAuth(AuthStrategy):
     Adds a custom header with the API key.
     """
     
+    __slots__ = ("_key", "_header_name", "_prefix", "_headers")
+    
     def __init__(self, key: str, header_name: str = "X-API-Key", prefix: str = ""):
         """
         Initialize API key authentication.
@@ -22,10 +24,45 @@ class APIKeyAuth(AuthStrategy):
             header_name: Name of the header to use (default: X-API-Key)
             prefix: Optional prefix to add to the key value
         """
-        self.key = key
-        self.header_name = header_name
+        self._key = key
+        self._header_name = header_name
         self.prefix = prefix
     
+    @property
+    def key(self) -> str:
+        """API key value."""
+        return self._key
+    
+    @key.setter
+    def key(self, value: str) -> None:
+        self._key = value
+        self._update_headers()
+    
+    @property
+    def header_name(self) -> str:
+        """Name of the header carrying the key."""
+        return self._header_name
+    
+    @header_name.setter
+    def header_name(self, value: str) -> None:
+        self._header_name = value
+        self._update_headers()
+    
+    @property
+    def prefix(self) -> str:
+        """Optional prefix added to the key value."""
+        return self._prefix
+    
+    @prefix.setter
+    def prefix(self, value: str) -> None:
+        self._prefix = value
+        self._update_headers()
+    
+    def _update_headers(self) -> None:
+        """Build the header once instead of on every request."""
+        value = f"{self._prefix}{self._key}" if self._prefix else self._key
+        self._headers = {self._header_name: value}
+    
     def get_headers(self) -> Dict[str, str]:
         """
         Get API key authentication headers.
@@ -33,5 +70,4 @@ class APIKeyAuth(AuthStrategy):
         Returns:
             Dictionary with the API key header
         """
-        value = f"{self.prefix}{self.key}" if self.prefix else self.key
-        return {self.header_name: value} 
\ No newline at end of file
+        return self._headers
@@ -14,11 +14,16 @@ class AuthStrategy(ABC):
     a consistent way to add authentication headers to requests.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_headers(self) -> Dict[str, str]:
         """
         Get authentication headers to add to the request.
         
+        Implementations may return the same dictionary on every call,
+        so callers must treat it as read-only.
+        
         Returns:
             Dictionary of headers to add to the request
         """
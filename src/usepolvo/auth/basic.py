@@ -14,6 +14,8 @@ class BasicAuth(AuthStrategy):
     Adds an Authorization header with Basic authentication.
     """
     
+    __slots__ = ("_username", "_password", "_headers")
+    
     def __init__(self, username: str, password: str):
         """
         Initialize Basic authentication.
@@ -22,9 +24,35 @@ class BasicAuth(AuthStrategy):
             username: Username for authentication
             password: Password for authentication
         """
-        self.username = username
+        self._username = username
         self.password = password
     
+    @property
+    def username(self) -> str:
+        """Username for authentication."""
+        return self._username
+    
+    @username.setter
+    def username(self, value: str) -> None:
+        self._username = value
+        self._update_headers()
+    
+    @property
+    def password(self) -> str:
+        """Password for authentication."""
+        return self._password
+    
+    @password.setter
+    def password(self, value: str) -> None:
+        self._password = value
+        self._update_headers()
+    
+    def _update_headers(self) -> None:
+        """Encode the credentials once instead of on every request."""
+        credentials = f"{self._username}:{self._password}"
+        encoded = base64.b64encode(credentials.encode()).decode()
+        self._headers = {"Authorization": f"Basic {encoded}"}
+    
     def get_headers(self) -> Dict[str, str]:
         """
         Get Basic authentication headers.
@@ -32,8 +60,4 @@ class BasicAuth(AuthStrategy):
         Returns:
             Dictionary with Authorization header
         """
-        # Encode username:password in base64
-        credentials = f"{self.username}:{self.password}"
-        encoded = base64.b64encode(credentials.encode()).decode()
-        
-        return {"Authorization": f"Basic {encoded}"} 
\ No newline at end of file
+        return self._headers
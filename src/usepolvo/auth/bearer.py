@@ -13,6 +13,8 @@ class BearerAuth(AuthStrategy):
     Adds an Authorization header with a Bearer token.
     """
     
+    __slots__ = ("_token", "_headers")
+    
     def __init__(self, token: str):
         """
         Initialize Bearer authentication.
@@ -22,6 +24,17 @@ class BearerAuth(AuthStrategy):
         """
         self.token = token
     
+    @property
+    def token(self) -> str:
+        """Bearer token used for authentication."""
+        return self._token
+    
+    @token.setter
+    def token(self, value: str) -> None:
+        self._token = value
+        # Build the header once instead of on every request
+        self._headers = {"Authorization": f"Bearer {value}"}
+    
     def get_headers(self) -> Dict[str, str]:
         """
         Get Bearer authentication headers.
@@ -29,4 +42,4 @@ class BearerAuth(AuthStrategy):
         Returns:
             Dictionary with Authorization header
         """
-        return {"Authorization": f"Bearer {self.token}"} 
\ No newline at end of file
+        return self._headers
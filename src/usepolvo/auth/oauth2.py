@@ -5,7 +5,6 @@ This is the crown jewel of the auth module - handles complex OAuth2 flows transp
 """
 
 import time
-import httpx
 import threading
 import warnings
 from typing import Dict, Optional
@@ -25,6 +24,11 @@ class OAuth2Flow(AuthStrategy):
     - Graceful error handling and recovery
     """
     
+    __slots__ = (
+        "client_id", "client_secret", "token_url", "scope", "storage",
+        "_lock", "_current_token", "_token_expires_at", "_header_token", "_headers"
+    )
+    
     def __init__(
         self,
         client_id: str,
@@ -65,6 +69,8 @@ class OAuth2Flow(AuthStrategy):
         self._lock = threading.Lock()
         self._current_token = None
         self._token_expires_at = 0
+        self._header_token = None
+        self._headers: Dict[str, str] = {}
         
         # Load existing token if available
         self._load_token()
@@ -77,7 +83,12 @@ class OAuth2Flow(AuthStrategy):
             Dictionary with Authorization header
         """
         token = self._get_valid_token()
-        return {"Authorization": f"Bearer {token}"}
+        
+        # Rebuild the header only when the token changes
+        if token is not self._header_token:
+            self._headers = {"Authorization": f"Bearer {token}"}
+            self._header_token = token
+        return self._headers
     
     async def get_headers_async(self) -> Dict[str, str]:
         """
@@ -103,9 +114,14 @@ class OAuth2Flow(AuthStrategy):
         Raises:
             Exception: If unable to obtain a valid token
         """
+        # Fast path: serve the in-memory token without taking the lock
+        token = self._current_token
+        if token and time.time() < self._token_expires_at - 60:  # 60s buffer
+            return token
+        
         with self._lock:
-            # Check if current token is still valid
-            if self._current_token and time.time() < self._token_expires_at - 60:  # 60s buffer
+            # Check again, another thread may have refreshed meanwhile
+            if self._current_token and time.time() < self._token_expires_at - 60:
                 return self._current_token
             
             # Need to refresh or obtain new token
@@ -130,31 +146,33 @@ class OAuth2Flow(AuthStrategy):
         if self.scope:
             data["scope"] = self.scope
         
+        # Reuse the process-wide connection pool instead of a throwaway client
+        from ..api import _get_default_client
+        
         try:
-            with httpx.Client() as client:
-                response = client.post(
-                    self.token_url,
-                    data=data,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                
-                token_data = response.json()
-                
-                # Extract token information
-                access_token = token_data["access_token"]
-                expires_in = token_data.get("expires_in", 3600)  # Default 1 hour
-                
-                # Update internal state
-                self._current_token = access_token
-                self._token_expires_at = time.time() + expires_in
-                
-                # Store token for persistence
-                self._store_token(token_data)
-                
-                return access_token
-                
+            response = _get_default_client().post(
+                self.token_url,
+                data=data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                timeout=30.0
+            )
+            response.raise_for_status()
+            
+            token_data = response.json()
+            
+            # Extract token information
+            access_token = token_data["access_token"]
+            expires_in = token_data.get("expires_in", 3600)  # Default 1 hour
+            
+            # Update internal state
+            self._current_token = access_token
+            self._token_expires_at = time.time() + expires_in
+            
+            # Store token for persistence
+            self._store_token(token_data)
+            
+            return access_token
+            
         except Exception as e:
             raise Exception(f"OAuth2 token refresh failed: {str(e)}")
     
@@ -217,6 +235,21 @@ class OAuth2Flow(AuthStrategy):
                 except Exception:
                     pass
     
+    def invalidate(self, token: Optional[str] = None):
+        """
+        Mark the in-memory token as expired so the next request refreshes it.
+        
+        Called by sessions when the API rejects the token with 401.
+        
+        Args:
+            token: The token that was rejected. If it has already been
+                replaced (e.g. by a concurrent request), nothing happens,
+                so a burst of 401s triggers a single refresh.
+        """
+        with self._lock:
+            if token is None or token == self._current_token:
+                self._token_expires_at = 0
+    
     def force_refresh(self) -> str:
         """
         Force a token refresh regardless of current token validity.
@@ -2,7 +2,7 @@
 Rate limiting module with convenient functions for common rate limit patterns.
 """
 
-from .resilience import RateLimiter, AdaptiveRateLimiter
+from .resilience import RateLimiter, AdaptiveRateLimiter, AdaptiveTokenBucket
 
 def fixed(requests_per_second: float, burst_size: int = None) -> RateLimiter:
     """
@@ -21,24 +21,34 @@ def fixed(requests_per_second: float, burst_size: int = None) -> RateLimiter:
     """
     return RateLimiter(requests_per_second, burst_size)
 
-def adaptive(initial_requests_per_second: float = 10.0) -> AdaptiveRateLimiter:
+def adaptive(
+    initial_requests_per_second: float = 10.0,
+    max_requests_per_second: float = None
+) -> AdaptiveTokenBucket:
     """
-    Create an adaptive rate limiter that adjusts based on API response headers.
+    Create an adaptive rate limiter that converges on the API's real quota.
     
-    This automatically reads rate limit headers from API responses and
-    adjusts the rate limit accordingly to avoid hitting limits.
+    Uses an Adaptive Token Bucket: the rate grows about once a second while
+    requests are waiting on it and is cut in half on a 429 response, honoring
+    Retry-After. Rate limit headers from API responses are also read to cap
+    the rate.
     
     Args:
         initial_requests_per_second: Initial rate limit
+        max_requests_per_second: Upper bound for the rate (default: 4x the
+            initial rate)
         
     Returns:
-        AdaptiveRateLimiter instance
+        AdaptiveTokenBucket instance
         
     Example:
         rate_limiter = polvo.rate_limit.adaptive(initial_requests_per_second=5)
         session = polvo.Session("https://api.example.com", rate_limit=rate_limiter)
     """
-    return AdaptiveRateLimiter(initial_requests_per_second)
+    return AdaptiveTokenBucket(
+        initial_requests_per_second,
+        max_requests_per_second=max_requests_per_second
+    )
 
 def conservative(requests_per_second: float = 1.0) -> RateLimiter:
     """
@@ -82,6 +92,7 @@ def twitter() -> AdaptiveRateLimiter:
 __all__ = [
     "RateLimiter",
     "AdaptiveRateLimiter",
+    "AdaptiveTokenBucket",
     "fixed",
     "adaptive",
     "conservative",
@@ -5,13 +5,48 @@ Provides retry with exponential backoff and rate limiting
 to handle real-world API integration challenges.
 """
 
+import asyncio
 import time
 import random
 import threading
-from typing import Callable, Any, Optional, Dict
+import uuid
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Any, Iterable, Optional, Dict, Tuple
 import httpx
 
 
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value into a delay in seconds.
+    
+    Supports both the delay-seconds and HTTP-date forms.
+    """
+    if not value:
+        return None
+    
+    # Common case: delay-seconds, checked without raising exceptions
+    # (isdigit alone also accepts non-ASCII digits such as "²")
+    if value.isascii() and value.isdigit():
+        return float(value)
+    
+    # Only fall back to HTTP-date parsing when the digit scan fails
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+# Write methods that get an Idempotency-Key so retries can't duplicate side effects
+IDEMPOTENT_RETRY_METHODS = frozenset({'POST', 'PUT', 'PATCH', 'DELETE'})
+
+# Methods that can be resent without risking duplicate side effects (RFC 9110)
+IDEMPOTENT_HTTP_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'TRACE', 'PUT', 'DELETE'})
+
+# Responses worth retrying by default: rate limited or any server error
+RETRYABLE_STATUS_CODES = frozenset({429, *range(500, 600)})
+
+
 class RetryStrategy:
     """
     Exponential backoff retry strategy with jitter.
@@ -19,13 +54,21 @@ class RetryStrategy:
     Handles transient failures gracefully with configurable retry logic.
     """
     
+    __slots__ = (
+        "max_retries", "base_delay", "max_delay", "exponential_base", "jitter", "idempotency",
+        "retry_status_codes", "retry_non_idempotent"
+    )
+    
     def __init__(
         self,
         max_retries: int = 3,
         base_delay: float = 1.0,
         max_delay: float = 60.0,
         exponential_base: float = 2.0,
-        jitter: bool = True
+        jitter: bool = True,
+        idempotency: bool = True,
+        retry_status_codes: Optional[Iterable[int]] = None,
+        retry_non_idempotent: bool = False
     ):
         """
         Initialize retry strategy.
@@ -36,19 +79,50 @@ class RetryStrategy:
             max_delay: Maximum delay in seconds
             exponential_base: Base for exponential backoff
             jitter: Whether to add random jitter to prevent thundering herd
+                (full jitter for exponential backoff, ±25% for fixed delays)
+            idempotency: Whether to send one Idempotency-Key across all attempts
+                of a write request
+            retry_status_codes: HTTP status codes to retry (default: 429 and 5xx)
+            retry_non_idempotent: Whether to resend POST/PATCH requests on those
+                status codes even when the caller supplied no Idempotency-Key
         """
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.jitter = jitter
+        self.idempotency = idempotency
+        self.retry_status_codes = (
+            RETRYABLE_STATUS_CODES if retry_status_codes is None
+            else frozenset(retry_status_codes)
+        )
+        self.retry_non_idempotent = retry_non_idempotent
     
-    def execute(self, func: Callable[[], Any]) -> Any:
+    def idempotency_key(self, method: str) -> Optional[str]:
+        """
+        Create the idempotency key for a logical request.
+        
+        Generated once per request and reused by every retry attempt, so the
+        server can deduplicate writes that were applied before a failure.
+        
+        Args:
+            method: HTTP method of the request
+            
+        Returns:
+            A new key for write methods, or None if not applicable
+        """
+        if self.idempotency and method.upper() in IDEMPOTENT_RETRY_METHODS:
+            return uuid.uuid4().hex
+        return None
+    
+    def execute(self, func: Callable[[], Any], resendable: Optional[bool] = None) -> Any:
         """
         Execute a function with retry logic.
         
         Args:
             func: Function to execute
+            resendable: Whether a retryable status code may resend the request
+                (default: decided from the response's method and headers)
             
         Returns:
             Result of the function
@@ -60,7 +134,7 @@ class RetryStrategy:
         
         for attempt in range(self.max_retries + 1):
             try:
-                return func()
+                result = func()
             except Exception as e:
                 last_exception = e
                 
@@ -73,12 +147,103 @@ class RetryStrategy:
                     break
                 
                 # Calculate delay
-                delay = self._calculate_delay(attempt)
+                delay = self._get_delay(attempt, getattr(e, 'response', None))
                 time.sleep(delay)
+                continue
+            
+            # Retry 429/5xx responses to resendable requests; the last attempt's response is returned
+            if (
+                attempt < self.max_retries
+                and self._should_retry_response(result, resendable)
+            ):
+                result.close()
+                time.sleep(self._get_delay(attempt, result))
+                continue
+            
+            return result
         
         # All retries exhausted
         raise last_exception
     
+    async def execute_async(
+        self,
+        func: Callable[[], Awaitable[Any]],
+        resendable: Optional[bool] = None
+    ) -> Any:
+        """
+        Execute a coroutine function with retry logic.
+        
+        Backoff uses asyncio.sleep, so other tasks keep running while a
+        request waits to be retried.
+        
+        Args:
+            func: Coroutine function to execute
+            resendable: Whether a retryable status code may resend the request
+                (default: decided from the response's method and headers)
+            
+        Returns:
+            Result of the coroutine
+            
+        Raises:
+            Exception: If all retries are exhausted
+        """
+        last_exception = None
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                result = await func()
+            except Exception as e:
+                last_exception = e
+                
+                if attempt == self.max_retries or not self._is_retryable(e):
+                    break
+                
+                await asyncio.sleep(self._get_delay(attempt, getattr(e, 'response', None)))
+                continue
+            
+            if (
+                attempt < self.max_retries
+                and self._should_retry_response(result, resendable)
+            ):
+                await result.aclose()
+                await asyncio.sleep(self._get_delay(attempt, result))
+                continue
+            
+            return result
+        
+        raise last_exception
+    
+    def _should_retry_response(self, result: Any, resendable: Optional[bool] = None) -> bool:
+        """
+        Check if a returned response should be retried.
+        
+        Only requests that are safe to resend qualify: idempotent methods,
+        or requests carrying an Idempotency-Key the server can deduplicate,
+        unless retry_non_idempotent opts in to resending everything.
+        """
+        if not isinstance(result, httpx.Response):
+            return False
+        if not self._is_retryable_status(result.status_code):
+            return False
+        if self.retry_non_idempotent:
+            return True
+        if resendable is None:
+            request = result.request
+            return request.method in IDEMPOTENT_HTTP_METHODS or 'idempotency-key' in request.headers
+        return resendable
+    
+    def _is_retryable_status(self, status_code: int) -> bool:
+        """Check if an HTTP status code is retryable (5xx server errors and 429 by default)."""
+        return status_code in self.retry_status_codes
+    
+    def _get_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Use the server's Retry-After if present, else exponential backoff."""
+        if response is not None:
+            retry_after = _parse_retry_after(response.headers.get('retry-after'))
+            if retry_after is not None:
+                return min(retry_after, self.max_delay)
+        return self._calculate_delay(attempt)
+    
     def _is_retryable(self, exception: Exception) -> bool:
         """Check if an exception is retryable."""
         # Retry on network errors and 5xx HTTP errors
@@ -90,8 +255,7 @@ class RetryStrategy:
             return True
         
         if isinstance(exception, httpx.HTTPStatusError):
-            # Retry on 5xx server errors and 429 rate limit
-            return exception.response.status_code >= 500 or exception.response.status_code == 429
+            return self._is_retryable_status(exception.response.status_code)
         
         return False
     
@@ -100,12 +264,17 @@ class RetryStrategy:
         delay = self.base_delay * (self.exponential_base ** attempt)
         delay = min(delay, self.max_delay)
         
-        if self.jitter:
-            # Add random jitter (±25%)
-            jitter_range = delay * 0.25
-            delay += random.uniform(-jitter_range, jitter_range)
+        if not self.jitter:
+            return max(0, delay)
+        
+        if self.exponential_base > 1:
+            # "Full jitter": spreading retries over [0, delay] decorrelates
+            # clients better than a small band around the backoff curve
+            return random.uniform(0, delay)
         
-        return max(0, delay)
+        # Fixed/linear delays keep their spacing, with ±25% jitter
+        jitter_range = delay * 0.25
+        return max(0, delay + random.uniform(-jitter_range, jitter_range))
 
 
 class RateLimiter:
@@ -115,6 +284,8 @@ class RateLimiter:
     Prevents overwhelming APIs with too many requests.
     """
     
+    __slots__ = ("requests_per_second", "burst_size", "_tokens", "_last_update", "_lock")
+    
     def __init__(self, requests_per_second: float, burst_size: Optional[int] = None):
         """
         Initialize rate limiter.
@@ -127,9 +298,34 @@ class RateLimiter:
         self.burst_size = burst_size or int(requests_per_second)
         
         self._tokens = float(self.burst_size)
-        self._last_update = time.time()
+        self._last_update = time.monotonic()
         self._lock = threading.Lock()
     
+    def _reserve(self, tokens: int) -> float:
+        """
+        Take tokens from the bucket and return how long to wait before using them.
+        
+        The bucket may go negative: the deficit is a reservation that later
+        refills pay back, so concurrent callers queue up in order without
+        holding the lock while they wait.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.requests_per_second
+    
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last update (call with the lock held)."""
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._tokens = min(
+            self.burst_size,
+            self._tokens + (elapsed * self.requests_per_second)
+        )
+        self._last_update = now
+    
     def acquire(self, tokens: int = 1) -> None:
         """
         Acquire tokens from the bucket, blocking if necessary.
@@ -137,24 +333,34 @@ class RateLimiter:
         Args:
             tokens: Number of tokens to acquire
         """
-        with self._lock:
-            now = time.time()
-            
-            # Add tokens based on time elapsed
-            elapsed = now - self._last_update
-            self._tokens = min(
-                self.burst_size,
-                self._tokens + (elapsed * self.requests_per_second)
-            )
-            self._last_update = now
-            
-            # If we don't have enough tokens, wait
-            if self._tokens < tokens:
-                wait_time = (tokens - self._tokens) / self.requests_per_second
-                time.sleep(wait_time)
-                self._tokens = 0
-            else:
-                self._tokens -= tokens
+        wait_time = self._reserve(tokens)
+        if wait_time > 0:
+            time.sleep(wait_time)
+    
+    async def acquire_async(self, tokens: int = 1) -> None:
+        """
+        Acquire tokens from the bucket without blocking the event loop.
+        
+        Args:
+            tokens: Number of tokens to acquire
+        """
+        wait_time = self._reserve(tokens)
+        if wait_time > 0:
+            try:
+                await asyncio.sleep(wait_time)
+            except asyncio.CancelledError:
+                # Hand the reservation back so callers queued behind a
+                # cancelled waiter don't pay for tokens nobody will use.
+                with self._lock:
+                    self._tokens = min(self.burst_size, self._tokens + tokens)
+                raise
+
+
+# (remaining, reset) header pairs understood by AdaptiveRateLimiter, in priority order
+RATE_LIMIT_HEADERS = (
+    ('x-ratelimit-remaining', 'x-ratelimit-reset'),    # GitHub style
+    ('x-rate-limit-remaining', 'x-rate-limit-reset'),  # Twitter style
+)
 
 
 class AdaptiveRateLimiter(RateLimiter):
@@ -164,6 +370,8 @@ class AdaptiveRateLimiter(RateLimiter):
     Reads rate limit information from common API headers and adjusts accordingly.
     """
     
+    __slots__ = ("initial_rate",)
+    
     def __init__(self, initial_requests_per_second: float = 10.0):
         """
         Initialize adaptive rate limiter.
@@ -187,15 +395,17 @@ class AdaptiveRateLimiter(RateLimiter):
         remaining = None
         reset_time = None
         
-        # GitHub style
-        if 'x-ratelimit-remaining' in headers and 'x-ratelimit-reset' in headers:
-            remaining = int(headers['x-ratelimit-remaining'])
-            reset_time = int(headers['x-ratelimit-reset'])
-        
-        # Twitter style
-        elif 'x-rate-limit-remaining' in headers and 'x-rate-limit-reset' in headers:
-            remaining = int(headers['x-rate-limit-remaining'])
-            reset_time = int(headers['x-rate-limit-reset'])
+        for remaining_header, reset_header in RATE_LIMIT_HEADERS:
+            remaining_value = headers.get(remaining_header)
+            reset_value = headers.get(reset_header)
+            if remaining_value is not None and reset_value is not None:
+                # Malformed values are ignored rather than failing the request
+                try:
+                    remaining = float(remaining_value)
+                    reset_time = float(reset_value)
+                except ValueError:
+                    return
+                break
         
         # Update rate if we have the information
         if remaining is not None and reset_time is not None:
@@ -207,7 +417,186 @@ class AdaptiveRateLimiter(RateLimiter):
                 safe_rate = (remaining * 0.9) / time_until_reset
                 
                 with self._lock:
-                    self.requests_per_second = max(0.1, safe_rate)
+                    self._apply_header_rate(safe_rate)
+    
+    def _apply_header_rate(self, safe_rate: float) -> None:
+        """Adopt the rate derived from rate limit headers (call with the lock held)."""
+        self.requests_per_second = max(0.1, safe_rate)
+
 
+ 
 
- 
\ No newline at end of file
+
+def atb_step(
+    rate: float,
+    congestion_rate: float,
+    success: bool,
+    min_rate: float,
+    max_rate: float,
+    additive_increase: float,
+    probe_factor: float,
+    backoff_factor: float
+) -> Tuple[float, float]:
+    """
+    Compute one Adaptive Token Bucket rate transition.
+    
+    Pure numeric function with no locking or I/O, so it can be driven in
+    bulk for offline simulations of limiter behaviour.
+    
+    Args:
+        rate: Current token generation rate (requests per second)
+        congestion_rate: Rate at which congestion was last observed
+        success: Whether the request succeeded (False means HTTP 429)
+        min_rate: Floor for the rate after backoff
+        max_rate: Ceiling for the rate
+        additive_increase: Minimum rate increase per step
+        probe_factor: Growth factor above the congestion rate
+        backoff_factor: Multiplicative decrease on failure
+        
+    Returns:
+        Tuple of (new rate, new congestion rate)
+    """
+    if success:
+        rate += max(additive_increase, probe_factor * (rate - congestion_rate))
+        return min(rate, max_rate), congestion_rate
+    return max(min_rate, backoff_factor * rate), rate
+
+
+class AdaptiveTokenBucket(AdaptiveRateLimiter):
+    """
+    Adaptive Token Bucket (ATB) rate limiter.
+    
+    Adjusts the token generation rate with AIMD feedback from responses:
+    successes raise the rate additively (faster once it is above the last
+    congestion point), a 429 halves it and empties the bucket. Like a TCP
+    congestion window, the rate changes at most once per increase_interval
+    rather than once per response, and only grows while callers are
+    actually waiting on the bucket; an app-limited client that never uses
+    up its rate keeps it where it is. The rate converges on the server's
+    actual quota instead of relying on blind backoff. Retry-After headers
+    on 429 responses pause acquisition for the advertised delay; queued
+    callers then resume at the reduced rate.
+    """
+    
+    __slots__ = (
+        "min_requests_per_second", "max_requests_per_second", "additive_increase",
+        "probe_factor", "backoff_factor", "congestion_rate", "increase_interval",
+        "_limited", "_last_change", "_last_backoff"
+    )
+    
+    def __init__(
+        self,
+        initial_requests_per_second: float = 10.0,
+        min_requests_per_second: float = 0.1,
+        max_requests_per_second: Optional[float] = None,
+        additive_increase: float = 0.1,
+        probe_factor: float = 0.1,
+        backoff_factor: float = 0.5,
+        increase_interval: float = 1.0
+    ):
+        """
+        Initialize adaptive token bucket.
+        
+        Args:
+            initial_requests_per_second: Starting token generation rate
+            min_requests_per_second: Floor for the rate after backoff (sigma)
+            max_requests_per_second: Ceiling for the rate (default: 4x the
+                initial rate)
+            additive_increase: Minimum rate increase per interval (delta)
+            probe_factor: Growth factor above the congestion rate (alpha)
+            backoff_factor: Multiplicative decrease on 429 (beta)
+            increase_interval: Minimum seconds between two rate changes
+        """
+        super().__init__(initial_requests_per_second)
+        self.min_requests_per_second = min_requests_per_second
+        self.max_requests_per_second = (
+            max_requests_per_second or 4 * initial_requests_per_second
+        )
+        self.additive_increase = additive_increase
+        self.probe_factor = probe_factor
+        self.backoff_factor = backoff_factor
+        self.congestion_rate = initial_requests_per_second
+        self.increase_interval = increase_interval
+        self._limited = False
+        self._last_change = time.monotonic()
+        self._last_backoff = float('-inf')
+    
+    def _reserve(self, tokens: int) -> float:
+        """Take tokens, remembering whether the rate made a caller wait."""
+        wait = super()._reserve(tokens)
+        if wait > 0:
+            self._limited = True
+        return wait
+    
+    def on_success(self) -> None:
+        """
+        Increase the rate after a successful request.
+        
+        At most one increase per increase_interval, and only if a caller had
+        to wait for tokens since the last change.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not self._limited or now - self._last_change < self.increase_interval:
+                return
+            self._limited = False
+            self._last_change = now
+            self.requests_per_second, self.congestion_rate = self._step(True)
+    
+    def _step(self, success: bool) -> Tuple[float, float]:
+        """Apply atb_step with this limiter's parameters."""
+        return atb_step(
+            self.requests_per_second,
+            self.congestion_rate,
+            success,
+            self.min_requests_per_second,
+            self.max_requests_per_second,
+            self.additive_increase,
+            self.probe_factor,
+            self.backoff_factor
+        )
+    
+    def on_failure(self, retry_after: Optional[float] = None) -> None:
+        """
+        Back off after the server signalled congestion (HTTP 429).
+        
+        Args:
+            retry_after: Seconds the server asked us to wait, if any
+        """
+        with self._lock:
+            self._refill()
+            # A burst of 429s answering the same window is one congestion
+            # signal; only back off again once the last backoff has settled.
+            now = time.monotonic()
+            if now - self._last_backoff >= self.increase_interval:
+                self.requests_per_second, self.congestion_rate = self._step(False)
+                self._last_backoff = now
+            self._limited = False
+            self._last_change = now
+            # Empty the bucket, keeping any outstanding reservations. A
+            # Retry-After pause becomes a deficit of tokens, so callers queue
+            # up behind it and resume one by one at the reduced rate.
+            pause = (retry_after or 0.0) * self.requests_per_second
+            self._tokens = min(self._tokens, -pause)
+    
+    def _apply_header_rate(self, safe_rate: float) -> None:
+        """Cap the AIMD rate with the header-derived rate, never raising it."""
+        self.requests_per_second = min(
+            self.requests_per_second,
+            max(self.min_requests_per_second, safe_rate)
+        )
+    
+    def update_from_response(self, response: httpx.Response) -> None:
+        """
+        Feed a response back into the limiter.
+        
+        Args:
+            response: HTTP response to analyze
+        """
+        if response.status_code == 429:
+            self.on_failure(_parse_retry_after(response.headers.get('retry-after')))
+        elif response.status_code < 500:
+            self.on_success()
+        
+        # Explicit rate limit headers still cap the rate
+        super().update_from_response(response)
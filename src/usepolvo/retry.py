@@ -2,13 +2,18 @@
 Retry module with convenient functions for common retry patterns.
 """
 
+from typing import Iterable, Optional
+
 from .resilience import RetryStrategy
 
 def exponential_backoff(
     max_retries: int = 3,
     base_delay: float = 1.0,
     max_delay: float = 60.0,
-    jitter: bool = True
+    jitter: bool = True,
+    idempotency: bool = True,
+    retry_status_codes: Optional[Iterable[int]] = None,
+    retry_non_idempotent: bool = False
 ) -> RetryStrategy:
     """
     Create an exponential backoff retry strategy.
@@ -18,6 +23,11 @@ def exponential_backoff(
         base_delay: Initial delay in seconds
         max_delay: Maximum delay in seconds
         jitter: Whether to add random jitter
+        idempotency: Whether to reuse one Idempotency-Key header across all
+            attempts of POST/PUT/PATCH/DELETE requests
+        retry_status_codes: HTTP status codes to retry (default: 429 and 5xx)
+        retry_non_idempotent: Whether to resend POST/PATCH requests on those
+            status codes without a caller-supplied Idempotency-Key
         
     Returns:
         RetryStrategy instance
@@ -30,7 +40,10 @@ def exponential_backoff(
         max_retries=max_retries,
         base_delay=base_delay,
         max_delay=max_delay,
-        jitter=jitter
+        jitter=jitter,
+        idempotency=idempotency,
+        retry_status_codes=retry_status_codes,
+        retry_non_idempotent=retry_non_idempotent
     )
 
 def linear_backoff(
@@ -9,21 +9,29 @@ import os
 import hashlib
 from pathlib import Path
 from typing import Dict, Any, Optional
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
 import getpass
 
+try:
+    import orjson
+except ImportError:  # Optional speedup
+    orjson = None
+
 from .base import TokenStorage
 
+# File layout: MAGIC || nonce (12 bytes) || AES-GCM ciphertext and tag
+_MAGIC = b"POLVO1"
+_NONCE_SIZE = 12
+
 
 class EncryptedFileStorage(TokenStorage):
     """
     Encrypted file storage for tokens.
     
-    Stores tokens in an encrypted file on disk using Fernet encryption.
+    Stores tokens in an encrypted file on disk using AES-256-GCM.
     The encryption key is derived from a password using PBKDF2.
+    Files written by older versions (Fernet) are still readable and are
+    upgraded on the next write.
     
     This is the recommended storage backend for production use.
     """
@@ -38,7 +46,8 @@ class EncryptedFileStorage(TokenStorage):
         """
         self.file_path = Path(file_path).expanduser()
         self.password = password or self._get_system_password()
-        self._fernet = None
+        self._key = None
+        self._aesgcm = None
         
         # Ensure directory exists
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -62,6 +71,11 @@ class EncryptedFileStorage(TokenStorage):
     
     def _init_encryption(self):
         """Initialize the encryption cipher."""
+        # Deferred so importing polvo.storage doesn't load cryptography
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+        
         # Create salt based on file path for consistency
         salt = hashlib.sha256(str(self.file_path).encode()).digest()[:16]
         
@@ -72,8 +86,26 @@ class EncryptedFileStorage(TokenStorage):
             salt=salt,
             iterations=100000,
         )
-        key = base64.urlsafe_b64encode(kdf.derive(self.password.encode()))
-        self._fernet = Fernet(key)
+        self._key = kdf.derive(self.password.encode())
+        self._aesgcm = AESGCM(self._key)
+    
+    def _decrypt(self, encrypted_data: bytes) -> bytes:
+        """Decrypt file contents, accepting the legacy Fernet format."""
+        if encrypted_data.startswith(_MAGIC):
+            header_size = len(_MAGIC) + _NONCE_SIZE
+            nonce = encrypted_data[len(_MAGIC):header_size]
+            return self._aesgcm.decrypt(nonce, encrypted_data[header_size:], _MAGIC)
+        
+        # Files written before the switch to AES-GCM
+        from cryptography.fernet import Fernet
+        
+        fernet = Fernet(base64.urlsafe_b64encode(self._key))
+        return fernet.decrypt(encrypted_data)
+    
+    def _encrypt(self, data: bytes) -> bytes:
+        """Encrypt data with a fresh random nonce."""
+        nonce = os.urandom(_NONCE_SIZE)
+        return _MAGIC + nonce + self._aesgcm.encrypt(nonce, data, _MAGIC)
     
     def _load_data(self) -> Dict[str, Dict[str, Any]]:
         """Load and decrypt data from file."""
@@ -88,7 +120,9 @@ class EncryptedFileStorage(TokenStorage):
                 return {}
             
             # Decrypt and parse JSON
-            decrypted_data = self._fernet.decrypt(encrypted_data)
+            decrypted_data = self._decrypt(encrypted_data)
+            if orjson is not None:
+                return orjson.loads(decrypted_data)
             return json.loads(decrypted_data.decode())
             
         except Exception:
@@ -99,8 +133,11 @@ class EncryptedFileStorage(TokenStorage):
         """Encrypt and save data to file."""
         try:
             # Convert to JSON and encrypt
-            json_data = json.dumps(data, indent=2).encode()
-            encrypted_data = self._fernet.encrypt(json_data)
+            if orjson is not None:
+                json_data = orjson.dumps(data)
+            else:
+                json_data = json.dumps(data, separators=(',', ':')).encode()
+            encrypted_data = self._encrypt(json_data)
             
             # Write to file atomically
             temp_path = self.file_path.with_suffix('.tmp')
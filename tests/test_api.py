@@ -0,0 +1,51 @@
+"""Tests for Session and AsyncSession in usepolvo.api."""
+
+import httpx
+import pytest
+
+from usepolvo.api import AsyncSession, Session
+
+
+def test_session_borrows_client():
+    client = httpx.Client()
+    session = Session("https://api.example.com", client=client)
+    
+    session.close()
+    
+    assert session._client is client
+    assert not client.is_closed
+    client.close()
+
+
+@pytest.mark.parametrize("options", [
+    {"http2": False},
+    {"verify": False},
+    {"limits": httpx.Limits(max_connections=1)},
+])
+def test_session_rejects_options_for_borrowed_client(options):
+    with httpx.Client() as client:
+        with pytest.raises(TypeError, match="client="):
+            Session("https://api.example.com", client=client, **options)
+
+
+async def test_async_session_borrows_client():
+    client = httpx.AsyncClient()
+    session = AsyncSession("https://api.example.com", client=client)
+    
+    await session.close()
+    
+    assert session._client is client
+    assert not client.is_closed
+    await client.aclose()
+
+
+@pytest.mark.parametrize("options", [
+    {"transport": "aiohttp"},
+    {"http2": False},
+    {"verify": False},
+    {"limits": httpx.Limits(max_connections=1)},
+])
+async def test_async_session_rejects_options_for_borrowed_client(options):
+    async with httpx.AsyncClient() as client:
+        with pytest.raises(TypeError, match="client="):
+            AsyncSession("https://api.example.com", client=client, **options)
@@ -0,0 +1,96 @@
+"""Tests for OAuth2 token refresh through Session and AsyncSession."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+import usepolvo.api
+from usepolvo.api import AsyncSession, Session
+from usepolvo.auth.oauth2 import OAuth2Flow
+from usepolvo.storage.memory import MemoryStorage
+
+CONCURRENCY = 8
+
+
+@pytest.fixture
+def token_requests(monkeypatch):
+    """Serve tok1, tok2, ... from a mock token endpoint on the shared client."""
+    requests = []
+    
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"access_token": f"tok{len(requests)}", "expires_in": 3600})
+    
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(usepolvo.api, "_default_client", client)
+    yield requests
+    client.close()
+
+
+def make_oauth():
+    return OAuth2Flow("client", "secret", "https://auth.example.com/token", storage=MemoryStorage())
+
+
+def test_concurrent_401s_refresh_the_token_once(token_requests):
+    oauth = make_oauth()
+    oauth.get_headers()  # tok1, which the API has since revoked
+    stale = threading.Barrier(CONCURRENCY)
+    
+    def handler(request):
+        if request.headers["Authorization"] == "Bearer tok1":
+            # Reject only once every request has been sent with the stale token
+            stale.wait(timeout=5)
+            return httpx.Response(401)
+        return httpx.Response(200)
+    
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    session = Session("https://api.example.com", auth=oauth, client=client)
+    
+    with ThreadPoolExecutor(CONCURRENCY) as pool:
+        responses = list(pool.map(lambda _: session.get("items"), range(CONCURRENCY)))
+    
+    assert [r.status_code for r in responses] == [200] * CONCURRENCY
+    assert len(token_requests) == 2
+    assert oauth.get_headers() == {"Authorization": "Bearer tok2"}
+    client.close()
+
+
+async def test_concurrent_async_401s_refresh_the_token_once(token_requests):
+    oauth = make_oauth()
+    oauth.get_headers()
+    stale_seen = 0
+    all_stale = asyncio.Event()
+    
+    async def handler(request):
+        nonlocal stale_seen
+        if request.headers["Authorization"] == "Bearer tok1":
+            stale_seen += 1
+            if stale_seen == CONCURRENCY:
+                all_stale.set()
+            await asyncio.wait_for(all_stale.wait(), timeout=5)
+            return httpx.Response(401)
+        return httpx.Response(200)
+    
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    session = AsyncSession("https://api.example.com", auth=oauth, client=client)
+    
+    responses = await asyncio.gather(*(session.get("items") for _ in range(CONCURRENCY)))
+    
+    assert [r.status_code for r in responses] == [200] * CONCURRENCY
+    assert len(token_requests) == 2
+    await client.aclose()
+
+
+def test_invalidate_ignores_a_token_that_was_already_replaced(token_requests):
+    oauth = make_oauth()
+    oauth.get_headers()
+    oauth.invalidate("tok1")
+    oauth.get_headers()
+    
+    oauth.invalidate("tok1")
+    
+    assert oauth.get_headers() == {"Authorization": "Bearer tok2"}
+    assert len(token_requests) == 2
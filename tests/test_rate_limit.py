@@ -0,0 +1,91 @@
+"""Tests for the rate limiters in usepolvo.resilience."""
+
+import asyncio
+
+import pytest
+
+from usepolvo.rate_limit import adaptive
+from usepolvo.resilience import AdaptiveTokenBucket, RateLimiter
+
+
+def test_adaptive_has_finite_default_ceiling():
+    limiter = adaptive(initial_requests_per_second=2)
+    
+    assert limiter.max_requests_per_second == 8
+
+
+def test_rate_grows_at_most_once_per_interval():
+    limiter = AdaptiveTokenBucket(10.0)
+    
+    for _ in range(1000):
+        limiter._reserve(1)
+        limiter.on_success()
+    
+    # Responses arrive far faster than increase_interval, so the rate moves
+    # once at most instead of once per response.
+    assert limiter.requests_per_second <= 10.0 + limiter.additive_increase
+
+
+def test_rate_does_not_grow_while_app_limited():
+    limiter = AdaptiveTokenBucket(10.0, increase_interval=0)
+    
+    for _ in range(1000):
+        limiter.on_success()
+    
+    assert limiter.requests_per_second == 10.0
+
+
+def test_rate_stays_bounded_over_many_successes():
+    limiter = AdaptiveTokenBucket(2.0, increase_interval=0)
+    
+    for _ in range(1000):
+        limiter._reserve(1)
+        limiter.on_success()
+        assert limiter.requests_per_second <= 8.0
+    
+    assert limiter.requests_per_second == 8.0
+
+
+def test_rate_converges_after_429s():
+    capacity = 20.0
+    limiter = AdaptiveTokenBucket(
+        5.0, max_requests_per_second=100.0, increase_interval=0
+    )
+    rates = []
+    
+    for _ in range(2000):
+        limiter._reserve(1)
+        if limiter.requests_per_second > capacity:
+            limiter.on_failure()
+        else:
+            limiter.on_success()
+        rates.append(limiter.requests_per_second)
+    
+    # After the first 429s the rate oscillates just around the server's
+    # capacity instead of drifting off to the ceiling or the floor.
+    settled = rates[-500:]
+    assert max(settled) <= capacity * 1.2
+    assert min(settled) >= capacity * limiter.backoff_factor * 0.9
+
+
+def test_burst_of_429s_backs_off_once():
+    limiter = AdaptiveTokenBucket(10.0)
+    
+    for _ in range(10):
+        limiter.on_failure()
+    
+    assert limiter.requests_per_second == pytest.approx(5.0)
+
+
+async def test_cancelled_waiters_refund_their_tokens():
+    limiter = RateLimiter(1.0, burst_size=1)
+    await limiter.acquire_async()
+    
+    waiters = [asyncio.create_task(limiter.acquire_async()) for _ in range(50)]
+    await asyncio.sleep(0)
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+    
+    # Only the token taken above is outstanding, not 50 abandoned reservations
+    assert limiter._reserve(1) <= 1.0
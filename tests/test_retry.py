@@ -0,0 +1,121 @@
+"""Tests for RetryStrategy and Retry-After handling in usepolvo.resilience."""
+
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from usepolvo.api import AsyncSession, Session
+from usepolvo.resilience import RetryStrategy, _parse_retry_after
+
+
+def flaky_handler(requests, failures=1, status_code=503):
+    """Mock transport handler that fails the first requests, then succeeds."""
+    def handler(request):
+        requests.append(request)
+        if len(requests) <= failures:
+            return httpx.Response(status_code, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"ok": True})
+    return handler
+
+
+def make_session(handler, retry=None):
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    return Session(
+        "https://api.example.com",
+        retry=retry or RetryStrategy(max_retries=3, base_delay=0),
+        client=client,
+    )
+
+
+def test_retry_after_seconds():
+    assert _parse_retry_after("120") == 120.0
+
+
+def test_retry_after_http_date():
+    delay = _parse_retry_after(formatdate(time.time() + 60, usegmt=True))
+    
+    assert 55 <= delay <= 60
+
+
+def test_retry_after_in_the_past_is_zero():
+    assert _parse_retry_after(formatdate(time.time() - 60, usegmt=True)) == 0.0
+
+
+@pytest.mark.parametrize("value", [None, "", "²", "١٢", "soon"])
+def test_retry_after_rejects_invalid_values(value):
+    assert _parse_retry_after(value) is None
+
+
+def test_get_is_retried_on_503():
+    requests = []
+    session = make_session(flaky_handler(requests, failures=2))
+    
+    response = session.get("items")
+    
+    assert response.status_code == 200
+    assert len(requests) == 3
+
+
+def test_retries_reuse_one_idempotency_key():
+    requests = []
+    session = make_session(flaky_handler(requests, failures=2))
+    
+    response = session.post("charges", json={"amount": 100}, headers={"Idempotency-Key": "abc"})
+    
+    assert response.status_code == 200
+    assert [r.headers["Idempotency-Key"] for r in requests] == ["abc"] * 3
+
+
+def test_retries_after_network_error_reuse_generated_key():
+    requests = []
+    
+    def handler(request):
+        requests.append(request)
+        if len(requests) == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200)
+    
+    session = make_session(handler)
+    
+    assert session.post("charges", json={"amount": 100}).status_code == 200
+    keys = {r.headers["Idempotency-Key"] for r in requests}
+    assert len(requests) == 2 and len(keys) == 1
+
+
+def test_post_with_generated_key_is_not_resent_on_503():
+    requests = []
+    session = make_session(flaky_handler(requests))
+    
+    response = session.post("charges", json={"amount": 100})
+    
+    # The server may not honour the key we generated, so don't risk a duplicate
+    assert response.status_code == 503
+    assert len(requests) == 1
+    assert "Idempotency-Key" in requests[0].headers
+
+
+def test_post_is_resent_on_503_when_opted_in():
+    requests = []
+    retry = RetryStrategy(max_retries=3, base_delay=0, retry_non_idempotent=True)
+    session = make_session(flaky_handler(requests), retry=retry)
+    
+    assert session.post("charges", json={"amount": 100}).status_code == 200
+    assert len(requests) == 2
+
+
+async def test_async_retries_reuse_one_idempotency_key():
+    requests = []
+    client = httpx.AsyncClient(transport=httpx.MockTransport(flaky_handler(requests, failures=2)))
+    session = AsyncSession(
+        "https://api.example.com",
+        retry=RetryStrategy(max_retries=3, base_delay=0),
+        client=client,
+    )
+    
+    response = await session.patch("items/1", json={"name": "x"}, headers={"Idempotency-Key": "abc"})
+    
+    assert response.status_code == 200
+    assert [r.headers["Idempotency-Key"] for r in requests] == ["abc"] * 3
+    await client.aclose()
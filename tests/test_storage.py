@@ -0,0 +1,76 @@
+"""Tests for the token storage backends in usepolvo.storage."""
+
+import base64
+import hashlib
+import json
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+from usepolvo.storage import EncryptedFileStorage
+
+TOKEN = {"access_token": "abc", "expires_at": 1700000000.5, "scopes": ["read"]}
+
+
+def legacy_fernet(file_path, password):
+    """Fernet cipher keyed the way versions before AES-GCM derived it."""
+    salt = hashlib.sha256(str(file_path).encode()).digest()[:16]
+    kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=salt, iterations=100000)
+    return Fernet(base64.urlsafe_b64encode(kdf.derive(password.encode())))
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "tokens.enc"
+    storage = EncryptedFileStorage(str(path), password="secret")
+    
+    storage.store_token("github", TOKEN)
+    
+    assert path.read_bytes().startswith(b"POLVO1")
+    assert b"abc" not in path.read_bytes()
+    assert EncryptedFileStorage(str(path), password="secret").get_token("github") == TOKEN
+
+
+def test_each_write_uses_a_fresh_nonce(tmp_path):
+    path = tmp_path / "tokens.enc"
+    storage = EncryptedFileStorage(str(path), password="secret")
+    
+    storage.store_token("github", TOKEN)
+    first = path.read_bytes()
+    storage.store_token("github", TOKEN)
+    
+    assert path.read_bytes() != first
+
+
+def test_wrong_password_reads_nothing(tmp_path):
+    path = tmp_path / "tokens.enc"
+    EncryptedFileStorage(str(path), password="secret").store_token("github", TOKEN)
+    
+    assert EncryptedFileStorage(str(path), password="wrong").get_token("github") is None
+
+
+def test_tampered_file_reads_nothing(tmp_path):
+    path = tmp_path / "tokens.enc"
+    EncryptedFileStorage(str(path), password="secret").store_token("github", TOKEN)
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 1
+    path.write_bytes(bytes(data))
+    
+    assert EncryptedFileStorage(str(path), password="secret").get_token("github") is None
+
+
+def test_reads_legacy_fernet_file_and_upgrades_it(tmp_path):
+    path = tmp_path / "tokens.enc"
+    fernet = legacy_fernet(path, "secret")
+    path.write_bytes(fernet.encrypt(json.dumps({"github": TOKEN}).encode()))
+    storage = EncryptedFileStorage(str(path), password="secret")
+    
+    assert storage.get_token("github") == TOKEN
+    
+    storage.store_token("gitlab", TOKEN)
+    assert path.read_bytes().startswith(b"POLVO1")
+    assert storage.get_token("github") == TOKEN
@@ -0,0 +1,113 @@
+"""Tests for AiohttpTransport against a local aiohttp server."""
+
+import gzip
+import socket
+
+import httpx
+import pytest
+
+web = pytest.importorskip("aiohttp.web")
+
+from usepolvo.api import AsyncSession
+from usepolvo.transport import AiohttpTransport
+
+
+async def echo(request):
+    return web.json_response({
+        "method": request.method,
+        "path": request.path_qs,
+        "headers": {k.lower(): v for k, v in request.headers.items()},
+        "body": (await request.read()).decode(),
+    })
+
+
+async def gzipped(request):
+    return web.Response(
+        body=gzip.compress(b'{"compressed": true}'),
+        headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+    )
+
+
+async def redirect(request):
+    raise web.HTTPFound("/echo")
+
+
+async def chunked(request):
+    response = web.StreamResponse()
+    await response.prepare(request)
+    for i in range(3):
+        await response.write(b"chunk%d\n" % i)
+    await response.write_eof()
+    return response
+
+
+@pytest.fixture
+async def base_url():
+    app = web.Application()
+    app.router.add_route("*", "/echo", echo)
+    app.router.add_get("/gzip", gzipped)
+    app.router.add_get("/redirect", redirect)
+    app.router.add_get("/chunked", chunked)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    yield f"http://{host}:{port}"
+    await runner.cleanup()
+
+
+async def test_get_with_query_and_headers(base_url):
+    async with AsyncSession(base_url, transport="aiohttp", headers={"X-Test": "1"}) as session:
+        response = await session.get("echo", params={"q": "polvo"})
+    
+    assert response.status_code == 200
+    assert response.http_version == "HTTP/1.1"
+    data = response.json()
+    assert data["method"] == "GET"
+    assert data["path"] == "/echo?q=polvo"
+    assert data["headers"]["x-test"] == "1"
+
+
+async def test_post_json_body(base_url):
+    async with AsyncSession(base_url, transport="aiohttp") as session:
+        response = await session.post("echo", json={"name": "polvo"})
+    
+    data = response.json()
+    assert data["method"] == "POST"
+    assert data["headers"]["content-type"] == "application/json"
+    assert httpx.Response(200, content=data["body"]).json() == {"name": "polvo"}
+
+
+async def test_httpx_decodes_compressed_body(base_url):
+    async with AsyncSession(base_url, transport="aiohttp") as session:
+        response = await session.get("gzip")
+    
+    assert response.json() == {"compressed": True}
+
+
+async def test_httpx_follows_redirects(base_url):
+    async with AsyncSession(base_url, transport="aiohttp", follow_redirects=True) as session:
+        response = await session.get("redirect")
+    
+    assert response.json()["path"] == "/echo"
+    assert len(response.history) == 1
+
+
+async def test_stream_reads_body_incrementally(base_url):
+    async with AsyncSession(base_url, transport="aiohttp") as session:
+        async with session.stream("GET", "chunked") as response:
+            lines = [line async for line in response.aiter_lines()]
+    
+    assert lines == ["chunk0", "chunk1", "chunk2"]
+
+
+async def test_connection_refused_maps_to_connect_error():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    
+    transport = AiohttpTransport()
+    async with httpx.AsyncClient(transport=transport) as client:
+        with pytest.raises(httpx.ConnectError):
+            await client.get(f"http://127.0.0.1:{port}/")